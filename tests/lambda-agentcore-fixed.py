@@ -1,9 +1,28 @@
 import logging
 import json
-from typing import Dict, Any, List
+import os
+from typing import Dict, Any, Tuple
+
+# orjson encodes in C; fall back to the stdlib when it is not packaged with the function
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # orjson.JSONEncodeError subclasses TypeError; the stdlib also
+            # handles values orjson rejects, e.g. integers wider than 64 bits
+            return json.dumps(obj)
+except ImportError:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+# Level comes from the LOG_LEVEL env var so noisy INFO output can be switched off per
+# function; unrecognised names fall back to INFO rather than failing the import
+_LOG_LEVEL = logging.getLevelName(os.environ.get('LOG_LEVEL', 'INFO').upper())
+logger.setLevel(_LOG_LEVEL if isinstance(_LOG_LEVEL, int) else logging.INFO)
 
 # --- MOCK DATA ---
 ACCOUNT_DETAILS: Dict[str, Dict[str, Any]] = {
@@ -12,25 +31,51 @@ ACCOUNT_DETAILS: Dict[str, Dict[str, Any]] = {
     "1122334455": {"sortCode": "990011", "balance": 98.10},
 }
 
+# Flat (accountId, sortCode) index so verification is a single lookup
+ACCOUNT_INDEX: Dict[Tuple[str, str], Dict[str, Any]] = {
+    (account_id, info["sortCode"]): info for account_id, info in ACCOUNT_DETAILS.items()
+}
+KNOWN_ACCOUNTS = frozenset(ACCOUNT_DETAILS)
+
+# --- RESPONSE MESSAGES ---
+_MISMATCH_MSG = "The provided account ID and sort code combination is incorrect. Please verify your details."
+_INTERNAL_ERROR_MSG = "An internal server error occurred while trying to fetch the balance."
+# Missing-parameter errors keyed by (has accountId, has sortCode)
+_MISSING_PARAMS_MSG: Dict[Tuple[bool, bool], str] = {
+    (False, False): "Error: The following required parameters are missing: 'accountId', 'sortCode'.",
+    (False, True):  "Error: The following required parameters are missing: 'accountId'.",
+    (True, False):  "Error: The following required parameters are missing: 'sortCode'.",
+}
+# Success replies depend only on the matched record, so render them once at cold start
+_BALANCE_MSG: Dict[Tuple[str, str], str] = {
+    (account_id, sort_code): (
+        f"The current balance for account ID {account_id} (Sort Code: {sort_code}) "
+        f"is ${info['balance']:,.2f}."
+    )
+    for (account_id, sort_code), info in ACCOUNT_INDEX.items()
+}
+
 def get_balance(account_id: str, sort_code: str) -> str:
     """Simulates the business logic to fetch a balance using both account ID and sort code."""
-    account_info = ACCOUNT_DETAILS.get(account_id)
-    if account_info is None:
-        return f"I could not find an account with the ID {account_id}."
-
-    # Validate the sort code against the mock data
-    if account_info.get("sortCode") != sort_code:
-        return "The provided account ID and sort code combination is incorrect. Please verify your details."
+    balance_message = _BALANCE_MSG.get((account_id, sort_code))
+    if balance_message is None:
+        if account_id not in KNOWN_ACCOUNTS:
+            return f"I could not find an account with the ID {account_id}."
+        # Account exists, so the sort code did not match the mock data
+        return _MISMATCH_MSG
 
     # If verification passes, return the balance
-    balance = account_info["balance"]
-    formatted_balance = f"${balance:,.2f}"
-    return f"The current balance for account ID {account_id} (Sort Code: {sort_code}) is {formatted_balance}."
+    return balance_message
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """AWS Lambda handler for AgentCore Gateway MCP calls."""
+    # Scheduled keep-warm ping (EventBridge rule with {"warmer": true})
+    if isinstance(event, dict) and event.get('warmer') is True:
+        return {'statusCode': 200, 'body': 'warm'}
+
     try:
-        logger.info('Received event: %s', json.dumps(event, indent=2))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Received event: %s', _json_dumps(event))
         
         # AgentCore Gateway sends parameters directly in the event
         account_id = event.get('accountId')
@@ -49,10 +94,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             }
         else:
             # Handle missing parameters
-            missing = []
-            if not account_id: missing.append("'accountId'")
-            if not sort_code: missing.append("'sortCode'")
-            error_message = f"Error: The following required parameters are missing: {', '.join(missing)}."
+            error_message = _MISSING_PARAMS_MSG[(bool(account_id), bool(sort_code))]
             
             logger.warning('Missing parameters: %s', error_message)
             
@@ -62,9 +104,20 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             }
             
     except Exception as e:
-        logger.error('Unexpected error in Lambda execution: %s', str(e), exc_info=True)
+        logger.error('Unexpected error in Lambda execution: %s', e, exc_info=True)
         
         return {
             'statusCode': 500,
-            'body': 'An internal server error occurred while trying to fetch the balance.'
-        }
\ No newline at end of file
+            'body': _INTERNAL_ERROR_MSG
+        }
+
+
+# Run the hot path once while provisioned concurrency or SnapStart initialises
+# the environment, so the first real request is served warm
+if os.environ.get('AWS_LAMBDA_INITIALIZATION_TYPE') in ('provisioned-concurrency', 'snap-start'):
+    # Keep the synthetic priming requests out of the function's logs
+    logging.disable(logging.INFO)
+    try:
+        lambda_handler({'accountId': '1234567890', 'sortCode': '112233'}, None)
+    finally:
+        logging.disable(logging.NOTSET)
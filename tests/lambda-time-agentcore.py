@@ -1,47 +1,69 @@
 import logging
 import json
+import os
 from typing import Dict, Any
-from datetime import datetime, timezone, timedelta
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+# orjson encodes in C; fall back to the stdlib when it is not packaged with the function
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # orjson.JSONEncodeError subclasses TypeError; the stdlib also
+            # handles values orjson rejects, e.g. integers wider than 64 bits
+            return json.dumps(obj)
+except ImportError:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+# Level comes from the LOG_LEVEL env var so noisy INFO output can be switched off per
+# function; unrecognised names fall back to INFO rather than failing the import
+_LOG_LEVEL = logging.getLevelName(os.environ.get('LOG_LEVEL', 'INFO').upper())
+logger.setLevel(_LOG_LEVEL if isinstance(_LOG_LEVEL, int) else logging.INFO)
+
+# Timezones are loaded once per container; ZoneInfo also applies DST rules
+TIMEZONES: Dict[str, ZoneInfo] = {
+    "UTC": ZoneInfo("UTC"),
+    "EST": ZoneInfo("America/New_York"),     # US Eastern Time
+    "PST": ZoneInfo("America/Los_Angeles"),  # US Pacific Time
+    "GMT": ZoneInfo("Etc/GMT"),              # Greenwich Mean Time (no DST)
+    "CET": ZoneInfo("Europe/Berlin"),        # Central European Time
+    "JST": ZoneInfo("Asia/Tokyo"),           # Japan Standard Time
+}
+_DEFAULT_TZ = TIMEZONES["UTC"]
 
 def get_current_time(timezone_name: str = "UTC") -> str:
     """Get current time in specified timezone or UTC by default."""
     try:
-        # Get current UTC time
-        utc_now = datetime.now(timezone.utc)
-        
-        # Define timezone offsets (simplified - doesn't handle DST)
-        timezone_offsets = {
-            "UTC": timedelta(hours=0),
-            "EST": timedelta(hours=-5),  # Eastern Standard Time
-            "PST": timedelta(hours=-8),  # Pacific Standard Time
-            "GMT": timedelta(hours=0),   # Greenwich Mean Time
-            "CET": timedelta(hours=1),   # Central European Time
-            "JST": timedelta(hours=9),   # Japan Standard Time
-        }
-        
-        # Default to UTC if timezone not recognized
-        if timezone_name.upper() not in timezone_offsets:
-            timezone_name = "UTC"
-            
-        offset = timezone_offsets[timezone_name.upper()]
-        local_time = utc_now + offset
+        # Normalise the name once; default to UTC if timezone not recognized
+        tz = TIMEZONES.get(timezone_name.upper(), _DEFAULT_TZ)
+
+        local_time = datetime.now(tz)
         
-        # Format the time nicely
-        formatted_time = local_time.strftime("%A, %B %d, %Y at %H:%M:%S")
+        # Format the time nicely; %Z gives the abbreviation actually in effect
+        # (e.g. EDT rather than EST in summer) so the label matches the time
+        formatted_time = local_time.strftime("%A, %B %d, %Y at %H:%M:%S %Z")
         
-        return f"The current time is {formatted_time} {timezone_name.upper()}."
+        return f"The current time is {formatted_time}."
         
     except Exception as e:
-        logger.error('Error getting time: %s', str(e))
+        logger.error('Error getting time: %s', e)
         return "I encountered an error while retrieving the current time."
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """AWS Lambda handler for AgentCore Gateway MCP calls - Current Time."""
+    # Scheduled keep-warm ping (EventBridge rule with {"warmer": true})
+    if isinstance(event, dict) and event.get('warmer') is True:
+        return {'statusCode': 200, 'body': 'warm'}
+
     try:
-        logger.info('Received event: %s', json.dumps(event, indent=2))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Received event: %s', _json_dumps(event))
         
         # AgentCore Gateway sends parameters directly in the event
         # Optional timezone parameter (defaults to UTC if not provided)
@@ -60,9 +82,20 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         }
             
     except Exception as e:
-        logger.error('Unexpected error in Lambda execution: %s', str(e), exc_info=True)
+        logger.error('Unexpected error in Lambda execution: %s', e, exc_info=True)
         
         return {
             'statusCode': 500,
             'body': 'An internal server error occurred while trying to get the current time.'
-        }
\ No newline at end of file
+        }
+
+
+# Run the hot path once while provisioned concurrency or SnapStart initialises
+# the environment, so the first real request is served warm
+if os.environ.get('AWS_LAMBDA_INITIALIZATION_TYPE') in ('provisioned-concurrency', 'snap-start'):
+    # Keep the synthetic priming requests out of the function's logs
+    logging.disable(logging.INFO)
+    try:
+        lambda_handler({'timezone': 'UTC'}, None)
+    finally:
+        logging.disable(logging.NOTSET)
@@ -1,5 +1,27 @@
 import json
-from datetime import datetime, timezone, timedelta
+import os
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+# orjson encodes in C; fall back to the stdlib when it is not packaged with the function
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # orjson.JSONEncodeError subclasses TypeError; the stdlib also
+            # handles values orjson rejects, e.g. integers wider than 64 bits
+            return json.dumps(obj)
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj)
+
+# Built once per container - zoneinfo is part of the standard library
+EASTERN_TZ = ZoneInfo('America/New_York')
+PACIFIC_TZ = ZoneInfo('America/Los_Angeles')
+LONDON_TZ = ZoneInfo('Europe/London')
 
 def lambda_handler(event, context):
     """
@@ -7,47 +29,55 @@ def lambda_handler(event, context):
     No external dependencies - uses only built-in Python libraries
     """
     
+    # Scheduled keep-warm ping (EventBridge rule with {"warmer": true})
+    if isinstance(event, dict) and event.get('warmer') is True:
+        return {'statusCode': 200, 'body': 'warm'}
+
     try:
         # Get current UTC time
         utc_now = datetime.now(timezone.utc)
         
-        # Calculate other timezones manually (simplified - doesn't handle DST)
-        eastern_offset = timedelta(hours=-5)  # EST
-        pacific_offset = timedelta(hours=-8)  # PST
-        london_offset = timedelta(hours=0)    # GMT (London winter time)
+        # Convert to other timezones (DST-aware)
+        eastern_time = utc_now.astimezone(EASTERN_TZ)
+        pacific_time = utc_now.astimezone(PACIFIC_TZ)
+        london_time = utc_now.astimezone(LONDON_TZ)
         
-        eastern_time = utc_now + eastern_offset
-        pacific_time = utc_now + pacific_offset
-        london_time = utc_now + london_offset
-        
-        # Format times
+        # Format times (each value once; the UTC strings are reused below)
+        utc_str = utc_now.strftime("%Y-%m-%d %H:%M:%S UTC")
+        readable = utc_now.strftime("%A, %B %d, %Y at %H:%M:%S UTC")
         time_data = {
-            "utc": utc_now.strftime("%Y-%m-%d %H:%M:%S UTC"),
-            "eastern": eastern_time.strftime("%Y-%m-%d %H:%M:%S EST"),
-            "pacific": pacific_time.strftime("%Y-%m-%d %H:%M:%S PST"),
-            "london": london_time.strftime("%Y-%m-%d %H:%M:%S GMT"),
+            "utc": utc_str,
+            "eastern": eastern_time.strftime("%Y-%m-%d %H:%M:%S %Z"),
+            "pacific": pacific_time.strftime("%Y-%m-%d %H:%M:%S %Z"),
+            "london": london_time.strftime("%Y-%m-%d %H:%M:%S %Z"),
             "timestamp": int(utc_now.timestamp()),
             "iso_format": utc_now.isoformat(),
-            "readable": utc_now.strftime("%A, %B %d, %Y at %H:%M:%S UTC")
+            "readable": readable
         }
         
         # Return in the same format as your banking tools
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': _json_dumps({
                 'success': True,
-                'message': f'Current time: {utc_now.strftime("%Y-%m-%d %H:%M:%S UTC")}',
+                'message': f'Current time: {utc_str}',
                 'data': time_data,
-                'formatted_response': f"The current time is {utc_now.strftime('%A, %B %d, %Y at %H:%M:%S UTC')}"
+                'formatted_response': f"The current time is {readable}"
             })
         }
         
     except Exception as e:
         return {
             'statusCode': 500,
-            'body': json.dumps({
+            'body': _json_dumps({
                 'success': False,
                 'message': f'Error getting time: {str(e)}',
                 'data': None
             })
-        }
\ No newline at end of file
+        }
+
+
+# Run the hot path once while provisioned concurrency or SnapStart initialises
+# the environment, so the first real request is served warm
+if os.environ.get('AWS_LAMBDA_INITIALIZATION_TYPE') in ('provisioned-concurrency', 'snap-start'):
+    lambda_handler({}, None)